@@ -11,4 +11,4 @@ import logging
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-__all__ = ["utils"]
+__all__ = ["timing"]
@@ -6,25 +6,68 @@ and rich comparisons, while staying lightweight and easy to use.
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+import time
+from collections.abc import Callable, Iterator
+from datetime import date, datetime
+from functools import lru_cache
+from typing import final
 
+# Seconds during which `Day.today()` reuses its last result.
+_TODAY_TTL = 1.0
 
+# Last `Day.today()` result as `(monotonic timestamp, ordinal)`, or `None`.
+_today_cache: tuple[float, int] | None = None
+
+# Largest ordinal representable by `datetime.date`.
+_MAX_ORDINAL = date.max.toordinal()
+
+# Default `Day.from_string` format, parsed through `date.fromisoformat`.
+_ISO_FORMAT = "%Y-%m-%d"
+
+# Number of distinct `(date_str, fmt)` pairs memoized by `Day.from_string`.
+_PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_ordinal(date_str: str, fmt: str) -> int:
+    """Parse `date_str` with `fmt` and return the ordinal of the resulting date.
+
+    Strings in the default ISO layout take the C `date.fromisoformat` path;
+    any other input goes through `datetime.strptime`. Results are memoized,
+    failures are not.
+    """
+    if fmt == _ISO_FORMAT and len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str).toordinal()
+        except ValueError:
+            pass  # let strptime produce the canonical error message
+    return datetime.strptime(date_str, fmt).toordinal()
+
+
+@final
 class Day:
     """Represents a specific calendar day (no time component).
 
-    Internally wraps a `datetime.date` to keep the concept strictly at
-    day-level precision (no hours/minutes/seconds, no timezone).
+    Internally stores the proleptic Gregorian ordinal of the date (as
+    returned by `datetime.date.toordinal`) as a plain `int`, keeping the concept
+    strictly at day-level precision (no hours/minutes/seconds, no timezone).
+    Comparisons and day arithmetic are plain integer operations; a
+    `datetime.date` is only built when the components are requested.
 
     The class supports:
       * Clean construction from year/month/day
-      * Alternate constructors from strings and `datetime.date`
+      * Alternate constructors from strings, `datetime.date` and ordinals
       * Easy access to `year`, `month`, `day`
       * String conversion as ISO date (YYYY-MM-DD)
       * Adding days (immutably, returns a new `Day`)
+      * Iterating over spans of days (`Day.range`)
       * Comparisons (`==`, `<`, `<=`, `>`, `>=`) based on calendar order
+      * Hashing, so days can be used in sets and as dict keys
 
     Memory footprint is minimized via `__slots__`, and instances behave
     immutably in practice (no public setters; methods return new instances).
+    The class is `final`:
+    comparisons check for exactly `Day` and do not support subclasses.
 
     Example:
         >>> d = Day(2025, 10, 24)
@@ -37,7 +80,10 @@ class Day:
         True
     """
 
-    __slots__ = ("_date",)
+    __slots__ = ("_ord", "_str")
+
+    _ord: int
+    _str: str | None
 
     def __init__(self, year: int, month: int, day: int) -> None:
         """Initialize a `Day` from its components.
@@ -54,7 +100,24 @@ class Day:
             >>> Day(2025, 1, 31)
             Day(2025, 1, 31)
         """
-        self._date = date(year, month, day)
+        self._ord = date(year, month, day).toordinal()
+        self._str = None
+
+    @classmethod
+    def _from_ordinal(cls, ordinal: int) -> Day:
+        """Build a `Day` directly from a proleptic Gregorian ordinal.
+
+        Skips `__init__` (and its `date` validation) for internal callers that
+        already hold a valid ordinal.
+        """
+        obj = object.__new__(cls)
+        obj._ord = ordinal
+        obj._str = None
+        return obj
+
+    def __reduce__(self) -> tuple[Callable[[int], Day], tuple[int]]:
+        """Support pickling/copying through the validating ordinal constructor."""
+        return (Day.from_ordinal, (self._ord,))
 
     # ---------- Alternate constructors ----------
 
@@ -62,6 +125,9 @@ class Day:
     def today(cls) -> Day:
         """Construct a `Day` representing the current local calendar date.
 
+        The system date is read at most once per second; calls in between
+        reuse the last value, which keeps tight polling loops cheap.
+
         Returns:
             A `Day` for today (according to the system’s local date).
 
@@ -69,13 +135,21 @@ class Day:
             >>> isinstance(Day.today(), Day)
             True
         """
-        d = date.today()
-        return cls(d.year, d.month, d.day)
+        global _today_cache
+        now = time.monotonic()
+        cached = _today_cache
+        if cached is None or now - cached[0] >= _TODAY_TTL:
+            cached = (now, date.today().toordinal())
+            _today_cache = cached  # single assignment, atomic under the GIL
+        return cls._from_ordinal(cached[1])
 
     @classmethod
-    def from_string(cls, date_str: str, fmt: str = "%Y-%m-%d") -> Day:
+    def from_string(cls, date_str: str, fmt: str = _ISO_FORMAT) -> Day:
         """Construct a `Day` by parsing a string.
 
+        ISO dates in the default format are parsed with `date.fromisoformat`,
+        and recent results are cached, so repeated strings are cheap.
+
         Args:
             date_str: The string to parse (e.g., "2025-10-24").
             fmt: A `datetime.strptime`-compatible format string.
@@ -93,8 +167,7 @@ class Day:
             >>> Day.from_string("24/10/2025", fmt="%d/%m/%Y")
             Day(2025, 10, 24)
         """
-        dt = datetime.strptime(date_str, fmt).date()
-        return cls(dt.year, dt.month, dt.day)
+        return cls._from_ordinal(_parse_ordinal(date_str, fmt))
 
     @classmethod
     def from_date(cls, d: date) -> Day:
@@ -110,18 +183,49 @@ class Day:
             >>> Day.from_date(date(2025, 10, 24))
             Day(2025, 10, 24)
         """
-        return cls(d.year, d.month, d.day)
+        return cls._from_ordinal(d.toordinal())
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> Day:
+        """Construct a `Day` from a proleptic Gregorian ordinal.
+
+        The counterpart of `to_ordinal`. Performance-sensitive code can keep
+        days as plain `int` ordinals and only convert to `Day` at the
+        boundaries (e.g., for display).
+
+        Args:
+            ordinal: Day number where January 1 of year 1 is day 1, as
+                returned by `datetime.date.toordinal`.
+
+        Returns:
+            The `Day` for that ordinal.
+
+        Raises:
+            ValueError: If `ordinal` is outside the supported date range.
+
+        Example:
+            >>> Day.from_ordinal(739548)
+            Day(2025, 10, 24)
+        """
+        if not 1 <= ordinal <= _MAX_ORDINAL:
+            raise ValueError(f"ordinal {ordinal} is out of range [1, {_MAX_ORDINAL}]")
+        return cls._from_ordinal(ordinal)
 
     # ---------- Representation ----------
 
     def __str__(self) -> str:
         """Return the ISO-8601 string representation (YYYY-MM-DD).
 
+        The string is computed on first use and kept on the instance.
+
         Example:
             >>> str(Day(2025, 10, 24))
             '2025-10-24'
         """
-        return self._date.isoformat()
+        s = self._str
+        if s is None:
+            s = self._str = date.fromordinal(self._ord).isoformat()
+        return s
 
     def __repr__(self) -> str:
         """Return an unambiguous constructor-style representation.
@@ -130,7 +234,8 @@ class Day:
             >>> repr(Day(2025, 10, 24))
             'Day(2025, 10, 24)'
         """
-        return f"Day({self.year}, {self.month}, {self.day})"
+        d = date.fromordinal(self._ord)
+        return f"Day({d.year}, {d.month}, {d.day})"
 
     # ---------- Accessors ----------
 
@@ -142,7 +247,7 @@ class Day:
             >>> Day(2025, 10, 24).year
             2025
         """
-        return self._date.year
+        return date.fromordinal(self._ord).year
 
     @property
     def month(self) -> int:
@@ -152,7 +257,7 @@ class Day:
             >>> Day(2025, 10, 24).month
             10
         """
-        return self._date.month
+        return date.fromordinal(self._ord).month
 
     @property
     def day(self) -> int:
@@ -162,7 +267,7 @@ class Day:
             >>> Day(2025, 10, 24).day
             24
         """
-        return self._date.day
+        return date.fromordinal(self._ord).day
 
     # ---------- Arithmetic ----------
 
@@ -177,11 +282,44 @@ class Day:
         Returns:
             A new `Day` representing `self + n days`.
 
+        Raises:
+            OverflowError: If the result falls outside the supported date range.
+
         Example:
             >>> Day(2025, 10, 24).add_days(7)
             Day(2025, 10, 31)
         """
-        return Day.from_date(self._date + timedelta(days=n))
+        ordinal = self._ord + n
+        if not 1 <= ordinal <= _MAX_ORDINAL:
+            raise OverflowError("date value out of range")
+        return Day._from_ordinal(ordinal)
+
+    @classmethod
+    def range(cls, start: Day, stop: Day, step: int = 1) -> Iterator[Day]:
+        """Iterate over the days from `start` (inclusive) to `stop` (exclusive).
+
+        Mirrors the built-in `range`: the iteration is done over integer
+        ordinals and each `Day` is built directly, so expanding long spans
+        costs one integer step per element instead of an `add_days` call.
+
+        Args:
+            start: First day of the sequence.
+            stop: Day at which the sequence stops (not included).
+            step: Number of days between consecutive elements (non-zero,
+                may be negative to iterate backwards).
+
+        Returns:
+            An iterator of `Day` instances.
+
+        Raises:
+            ValueError: If `step` is zero.
+
+        Example:
+            >>> list(Day.range(Day(2025, 10, 30), Day(2025, 11, 2)))
+            [Day(2025, 10, 30), Day(2025, 10, 31), Day(2025, 11, 1)]
+        """
+        # Build the `range` eagerly so a zero step fails here, not on first use
+        return _iter_days(range(start._ord, stop._ord, step))
 
     # ---------- Comparison operators ----------
 
@@ -196,7 +334,19 @@ class Day:
             >>> Day(2025, 10, 24) == "2025-10-24"
             False
         """
-        return isinstance(other, Day) and self._date == other._date
+        return type(other) is Day and self._ord == other._ord
+
+    def __hash__(self) -> int:
+        """Return a hash consistent with `__eq__`, so days work in sets and dicts.
+
+        The ordinal already is a small positive `int`, so it is used as the
+        hash directly with no extra computation.
+
+        Example:
+            >>> len({Day(2025, 10, 24), Day(2025, 10, 24)})
+            1
+        """
+        return self._ord
 
     def __lt__(self, other: Day) -> bool:
         """Return `True` if `self` occurs before `other` in calendar order.
@@ -211,30 +361,48 @@ class Day:
             >>> Day(2025, 10, 24) < Day(2025, 10, 31)
             True
         """
-        if not isinstance(other, Day):
+        if type(other) is not Day:
             return NotImplemented
-        return self._date < other._date
+        return self._ord < other._ord
 
     def __le__(self, other: Day) -> bool:
         """Return `True` if `self` is earlier than or equal to `other`."""
-        if not isinstance(other, Day):
+        if type(other) is not Day:
             return NotImplemented
-        return self._date <= other._date
+        return self._ord <= other._ord
 
     def __gt__(self, other: Day) -> bool:
         """Return `True` if `self` occurs after `other`."""
-        if not isinstance(other, Day):
+        if type(other) is not Day:
             return NotImplemented
-        return self._date > other._date
+        return self._ord > other._ord
 
     def __ge__(self, other: Day) -> bool:
         """Return `True` if `self` is later than or equal to `other`."""
-        if not isinstance(other, Day):
+        if type(other) is not Day:
             return NotImplemented
-        return self._date >= other._date
+        return self._ord >= other._ord
 
     # ---------- Interop ----------
 
+    def to_ordinal(self) -> int:
+        """Return the proleptic Gregorian ordinal of this day.
+
+        Same numbering as `datetime.date.toordinal`. Ordinals compare and
+        subtract like the days they represent, so hot loops can operate on
+        `int` values and only upcast to `Day` when needed. It also makes a
+        cheap sort key: `sorted(days, key=Day.to_ordinal)` compares plain
+        ints instead of calling `Day.__lt__`.
+
+        Returns:
+            The ordinal as an `int`.
+
+        Example:
+            >>> Day(2025, 10, 24).to_ordinal()
+            739548
+        """
+        return self._ord
+
     def to_date(self) -> date:
         """Return the underlying `datetime.date`.
 
@@ -242,10 +410,20 @@ class Day:
         that expects a `datetime.date`.
 
         Returns:
-            The wrapped `datetime.date`.
+            A `datetime.date` for the same calendar day.
 
         Example:
             >>> isinstance(Day(2025, 10, 24).to_date(), date)
             True
         """
-        return self._date
+        return date.fromordinal(self._ord)
+
+
+def _iter_days(ordinals: range) -> Iterator[Day]:
+    """Yield a new `Day` for each ordinal, bypassing `__init__` validation."""
+    new = object.__new__
+    for ordinal in ordinals:
+        d = new(Day)
+        d._ord = ordinal
+        d._str = None
+        yield d
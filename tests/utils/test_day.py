@@ -1,6 +1,9 @@
+import pickle
+import time
 import unittest
-from datetime import date
+from datetime import date, datetime
 
+from yasched.timing import Day as day_module
 from yasched.timing.Day import Day
 
 
@@ -24,6 +27,12 @@ class TestDay(unittest.TestCase):
         with self.assertRaises(AttributeError):
             d.foo = "bar"  # __slots__ prevents this
 
+    def test_pickle_roundtrip(self):
+        d = Day(2025, 10, 24)
+        self.assertEqual(pickle.loads(pickle.dumps(d)), d)
+        # Unpickling goes through the validating constructor
+        self.assertEqual(d.__reduce__(), (Day.from_ordinal, (d.to_ordinal(),)))
+
     # ---------- Alternate Constructors ----------
 
     def test_today(self):
@@ -34,6 +43,17 @@ class TestDay(unittest.TestCase):
         self.assertEqual(d.month, today.month)
         self.assertEqual(d.day, today.day)
 
+    def test_today_reuses_recent_value(self):
+        saved = day_module._today_cache
+        try:
+            day_module._today_cache = (time.monotonic(), date(2000, 1, 1).toordinal())
+            self.assertEqual(Day.today(), Day(2000, 1, 1))
+            # An expired entry is refreshed from the system date
+            day_module._today_cache = (time.monotonic() - 2 * day_module._TODAY_TTL, date(2000, 1, 1).toordinal())
+            self.assertEqual(Day.today().to_date(), date.today())
+        finally:
+            day_module._today_cache = saved
+
     def test_from_string_default_iso(self):
         d = Day.from_string("2025-10-24")
         self.assertEqual((d.year, d.month, d.day), (2025, 10, 24))
@@ -47,17 +67,52 @@ class TestDay(unittest.TestCase):
         with self.assertRaises(ValueError):
             Day.from_string("not-a-date")
 
+    def test_from_string_default_format_edge_cases(self):
+        # Non zero-padded input is still accepted through strptime
+        self.assertEqual(Day.from_string("2025-1-5"), Day(2025, 1, 5))
+        with self.assertRaises(ValueError):
+            Day.from_string("2025-02-30")
+        with self.assertRaises(ValueError):
+            Day.from_string("2025-W43-5")  # ISO week date, not "%Y-%m-%d"
+
+    def test_from_string_repeated(self):
+        day_module._parse_ordinal.cache_clear()
+        first = Day.from_string("2025-10-24")
+        self.assertEqual(Day.from_string("2025-10-24"), first)
+        self.assertEqual(Day.from_string("2025/10/24", fmt="%Y/%m/%d"), first)
+        info = day_module._parse_ordinal.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+        self.assertEqual(info.maxsize, day_module._PARSE_CACHE_SIZE)
+
     def test_from_date(self):
         base = date(2025, 10, 24)
         d = Day.from_date(base)
         self.assertEqual(d.to_date(), base)
 
+    def test_from_date_accepts_datetime(self):
+        self.assertEqual(Day.from_date(datetime(2025, 10, 24, 23, 59)), Day(2025, 10, 24))
+
+    def test_from_ordinal(self):
+        base = date(2025, 10, 24)
+        self.assertEqual(Day.from_ordinal(base.toordinal()), Day(2025, 10, 24))
+
+    def test_from_ordinal_out_of_range_raises(self):
+        with self.assertRaises(ValueError):
+            Day.from_ordinal(0)
+        with self.assertRaises(ValueError):
+            Day.from_ordinal(date.max.toordinal() + 1)
+
     # ---------- Representation ----------
 
     def test_str_isoformat(self):
         d = Day(2025, 1, 9)
         self.assertEqual(str(d), "2025-01-09")
 
+    def test_str_is_computed_once(self):
+        d = Day(2031, 7, 4)
+        self.assertIs(str(d), str(d))
+        self.assertEqual(str(d.add_days(1)), "2031-07-05")
+
     def test_repr_unambiguous(self):
         d = Day(1999, 12, 31)
         self.assertEqual(repr(d), "Day(1999, 12, 31)")
@@ -101,6 +156,35 @@ class TestDay(unittest.TestCase):
         d = Day(2024, 3, 1)
         self.assertEqual(str(d.add_days(-1)), "2024-02-29")
 
+    def test_add_days_overflow_raises(self):
+        with self.assertRaises(OverflowError):
+            Day(9999, 12, 31).add_days(1)
+        with self.assertRaises(OverflowError):
+            Day(1, 1, 1).add_days(-5)
+        # The extreme days themselves remain reachable
+        self.assertEqual(Day(9999, 12, 30).add_days(1), Day(9999, 12, 31))
+        self.assertEqual(Day(1, 1, 2).add_days(-1), Day(1, 1, 1))
+
+    def test_add_days_matches_date_arithmetic(self):
+        base = date(2025, 10, 24)
+        d = Day.from_date(base)
+        for n in (-1000, -366, -1, 0, 1, 59, 366, 1000):
+            self.assertEqual(d.add_days(n).to_date(), date.fromordinal(base.toordinal() + n))
+
+    def test_range(self):
+        days = list(Day.range(Day(2024, 12, 30), Day(2025, 1, 2)))
+        self.assertEqual(days, [Day(2024, 12, 30), Day(2024, 12, 31), Day(2025, 1, 1)])
+
+    def test_range_step_and_empty(self):
+        start, stop = Day(2025, 1, 1), Day(2025, 1, 15)
+        self.assertEqual([str(d) for d in Day.range(start, stop, 7)], ["2025-01-01", "2025-01-08"])
+        self.assertEqual(list(Day.range(stop, start)), [])
+        self.assertEqual(list(Day.range(start, start.add_days(-2), -1)), [start, start.add_days(-1)])
+
+    def test_range_zero_step_raises(self):
+        with self.assertRaises(ValueError):
+            Day.range(Day(2025, 1, 1), Day(2025, 1, 2), 0)
+
     # ---------- Comparisons ----------
 
     def test_equality(self):
@@ -136,12 +220,25 @@ class TestDay(unittest.TestCase):
         self.assertIs(Day.__gt__(a, object()), NotImplemented)
         self.assertIs(Day.__ge__(a, None), NotImplemented)
 
+    def test_hash_consistent_with_equality(self):
+        a = Day(2025, 10, 24)
+        b = Day(2025, 10, 23).add_days(1)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b, Day(2025, 10, 25)}), 2)
+        self.assertEqual({a: "x"}[b], "x")
+
     def test_sorting(self):
         seq = [Day(2025, 1, 3), Day(2024, 12, 31), Day(2025, 1, 1)]
         self.assertEqual(sorted(seq), [Day(2024, 12, 31), Day(2025, 1, 1), Day(2025, 1, 3)])
+        self.assertEqual(sorted(seq, key=Day.to_ordinal), sorted(seq))
 
     # ---------- Interop ----------
 
+    def test_to_ordinal(self):
+        d = Day(2025, 10, 24)
+        self.assertEqual(d.to_ordinal(), date(2025, 10, 24).toordinal())
+        self.assertEqual(d.add_days(10).to_ordinal() - d.to_ordinal(), 10)
+
     def test_to_date(self):
         d = Day(2025, 10, 24)
         self.assertIsInstance(d.to_date(), date)